@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
 
 import uvicorn
 from dotenv import load_dotenv
@@ -8,6 +10,13 @@ from starlette.applications import Starlette
 from starlette.routing import Mount
 
 from server.tools.tools import register_tools
+from server.trello import get_client
+
+try:
+    # Optional speedup: libuv-based event loop (not available on Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +35,23 @@ mcp = FastMCP("Trello MCP Server")
 register_tools(mcp)
 
 
+async def run_stdio():
+    """Run the stdio transport, closing the shared Trello client on exit."""
+    async with get_client():
+        await mcp.run_stdio_async()
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    """Close the shared Trello client's connection pool when the app shuts down.
+
+    FastMCP's own lifespan runs once per SSE session, so the client is tied to
+    the Starlette app lifetime instead.
+    """
+    async with get_client():
+        yield
+
+
 def start_claude_server():
     """Start the MCP server in Claude app mode"""
     try:
@@ -36,7 +62,10 @@ def start_claude_server():
             )
 
         logger.info("Starting Trello MCP Server in Claude app mode...")
-        mcp.run()
+        if uvloop is not None:
+            uvloop.run(run_stdio())
+        else:
+            asyncio.run(run_stdio())
         logger.info("Trello MCP Server started successfully")
     except Exception as e:
         logger.error(f"Error starting Claude server: {str(e)}")
@@ -59,12 +88,14 @@ def start_sse_server():
         app = Starlette(
             routes=[
                 Mount("/", app=mcp.sse_app()),
-            ]
+            ],
+            lifespan=lifespan,
         )
 
         logger.info(
             f"Starting Trello MCP Server in SSE mode on http://{host}:{port}..."
         )
+        # uvicorn's default loop="auto" already picks uvloop when it is installed
         uvicorn.run(app, host=host, port=port)
     except Exception as e:
         logger.error(f"Error starting SSE server: {str(e)}")
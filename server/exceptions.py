@@ -53,9 +53,9 @@ class ForbiddenError(TrelloMCPError):
 class RateLimitError(TrelloMCPError):
     """Raised when API rate limit is exceeded (429)."""
 
-    def __init__(self, retry_after: Optional[int] = None):
+    def __init__(self, retry_after: Optional[float] = None):
         if retry_after:
-            message = f"Trello API rate limit exceeded. Please retry after {retry_after} seconds."
+            message = f"Trello API rate limit exceeded. Please retry after {retry_after:g} seconds."
         else:
             message = "Trello API rate limit exceeded. Please wait a moment and try again."
         super().__init__(message, status_code=429)
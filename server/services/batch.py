@@ -18,7 +18,7 @@ class BatchService:
         """
         self.client = client
 
-    def batch_get(self, urls: List[str]) -> List[Dict[str, Any]]:
+    async def batch_get(self, urls: List[str]) -> List[Dict[str, Any]]:
         """
         Execute multiple GET requests in a single batch.
 
@@ -31,8 +31,4 @@ class BatchService:
         if len(urls) > 10:
             raise ValueError("Maximum 10 URLs allowed per batch request")
 
-        # Join URLs with comma
-        urls_param = ",".join(urls)
-        
-        response = self.client.get("/batch", params={"urls": urls_param})
-        return response
+        return await self.client.batch_get(urls)
@@ -2,7 +2,7 @@
 Service for managing Trello webhooks in MCP server.
 """
 
-from typing import List
+from typing import AsyncIterator, List
 
 from server.models import TrelloWebhook
 from server.utils.trello_api import TrelloClient
@@ -16,17 +16,18 @@ class WebhookService:
     def __init__(self, client: TrelloClient):
         self.client = client
 
-    async def create_webhook(self, **kwargs) -> TrelloWebhook:
+    async def create_webhook(self, params: dict) -> TrelloWebhook:
         """Create a new webhook.
 
         Args:
-            **kwargs: Webhook parameters (callbackURL, idModel, description, active)
+            params (dict): Webhook API parameters (callbackURL, idModel, description, active)
 
         Returns:
             TrelloWebhook: The created webhook object.
         """
-        response = await self.client.POST("/webhooks/", params=kwargs)
-        return TrelloWebhook(**response)
+        return await self.client.POST(
+            "/webhooks/", params=params, response_type=TrelloWebhook
+        )
 
     async def get_webhook(self, webhook_id: str) -> TrelloWebhook:
         """Retrieves a specific webhook by ID.
@@ -37,8 +38,9 @@ class WebhookService:
         Returns:
             TrelloWebhook: The webhook object.
         """
-        response = await self.client.GET(f"/webhooks/{webhook_id}")
-        return TrelloWebhook(**response)
+        return await self.client.GET(
+            f"/webhooks/{webhook_id}", response_type=TrelloWebhook
+        )
 
     async def list_webhooks(self, token: str) -> List[TrelloWebhook]:
         """Retrieves all webhooks for a token.
@@ -49,21 +51,35 @@ class WebhookService:
         Returns:
             List[TrelloWebhook]: A list of webhook objects.
         """
-        response = await self.client.GET(f"/tokens/{token}/webhooks")
-        return [TrelloWebhook(**webhook) for webhook in response]
+        return await self.client.GET(
+            f"/tokens/{token}/webhooks", response_type=List[TrelloWebhook]
+        )
 
-    async def update_webhook(self, webhook_id: str, **kwargs) -> TrelloWebhook:
+    async def stream_webhooks(self, token: str) -> AsyncIterator[TrelloWebhook]:
+        """Streams all webhooks for a token, yielding each as it is decoded.
+
+        Args:
+            token (str): The API token.
+
+        Yields:
+            TrelloWebhook: Each webhook object.
+        """
+        async for webhook in self.client.stream_get(f"/tokens/{token}/webhooks"):
+            yield TrelloWebhook(**webhook)
+
+    async def update_webhook(self, webhook_id: str, params: dict) -> TrelloWebhook:
         """Update a webhook.
 
         Args:
             webhook_id (str): The ID of the webhook.
-            **kwargs: Update parameters (callbackURL, description, active)
+            params (dict): Update API parameters (callbackURL, description, active)
 
         Returns:
             TrelloWebhook: The updated webhook object.
         """
-        response = await self.client.PUT(f"/webhooks/{webhook_id}", params=kwargs)
-        return TrelloWebhook(**response)
+        return await self.client.PUT(
+            f"/webhooks/{webhook_id}", params=params, response_type=TrelloWebhook
+        )
 
     async def delete_webhook(self, webhook_id: str) -> dict:
         """Delete a webhook.
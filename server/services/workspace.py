@@ -2,7 +2,7 @@
 Service for managing Trello workspaces/organizations in MCP server.
 """
 
-from typing import List
+from typing import AsyncIterator, List
 
 from server.models import TrelloBoard, TrelloOrganization
 from server.utils.trello_api import TrelloClient
@@ -26,8 +26,10 @@ class WorkspaceService:
         Returns:
             List[TrelloOrganization]: A list of workspace/organization objects.
         """
-        response = await self.client.GET(f"/members/{member_id}/organizations")
-        return [TrelloOrganization(**org) for org in response]
+        return await self.client.GET(
+            f"/members/{member_id}/organizations",
+            response_type=List[TrelloOrganization],
+        )
 
     async def get_workspace(self, workspace_id: str) -> TrelloOrganization:
         """Retrieves a specific workspace by its ID.
@@ -38,8 +40,9 @@ class WorkspaceService:
         Returns:
             TrelloOrganization: The workspace object containing workspace details.
         """
-        response = await self.client.GET(f"/organizations/{workspace_id}")
-        return TrelloOrganization(**response)
+        return await self.client.GET(
+            f"/organizations/{workspace_id}", response_type=TrelloOrganization
+        )
 
     async def get_workspace_boards(
         self, workspace_id: str, filter_value: str = "all"
@@ -55,37 +58,60 @@ class WorkspaceService:
             List[TrelloBoard]: A list of board objects in the workspace.
         """
         params = {"filter": filter_value}
-        response = await self.client.GET(
-            f"/organizations/{workspace_id}/boards", params=params
+        return await self.client.GET(
+            f"/organizations/{workspace_id}/boards",
+            params=params,
+            response_type=List[TrelloBoard],
         )
-        return [TrelloBoard(**board) for board in response]
 
-    async def create_workspace(self, **kwargs) -> TrelloOrganization:
+    async def stream_workspace_boards(
+        self, workspace_id: str, filter_value: str = "all"
+    ) -> AsyncIterator[TrelloBoard]:
+        """Streams all boards in a workspace, yielding each as it is decoded.
+
+        Args:
+            workspace_id (str): The ID of the workspace whose boards to retrieve.
+            filter_value (str): Filter for boards. Defaults to "all".
+
+        Yields:
+            TrelloBoard: Each board object in the workspace.
+        """
+        params = {"filter": filter_value}
+        async for board in self.client.stream_get(
+            f"/organizations/{workspace_id}/boards", params=params
+        ):
+            yield TrelloBoard(**board)
+
+    async def create_workspace(self, params: dict) -> TrelloOrganization:
         """Create a new workspace/organization.
 
         Args:
-            **kwargs: Workspace creation parameters (displayName, desc, name, website)
+            params (dict): Workspace creation API parameters (displayName, desc, name, website)
 
         Returns:
             TrelloOrganization: The newly created workspace object.
         """
-        response = await self.client.POST("/organizations", params=kwargs)
-        return TrelloOrganization(**response)
+        return await self.client.POST(
+            "/organizations", params=params, response_type=TrelloOrganization
+        )
 
     async def update_workspace(
-        self, workspace_id: str, **kwargs
+        self, workspace_id: str, params: dict
     ) -> TrelloOrganization:
         """Update an existing workspace.
 
         Args:
             workspace_id (str): The ID of the workspace to update.
-            **kwargs: Workspace update parameters
+            params (dict): Workspace update API parameters
 
         Returns:
             TrelloOrganization: The updated workspace object.
         """
-        response = await self.client.PUT(f"/organizations/{workspace_id}", params=kwargs)
-        return TrelloOrganization(**response)
+        return await self.client.PUT(
+            f"/organizations/{workspace_id}",
+            params=params,
+            response_type=TrelloOrganization,
+        )
 
     async def delete_workspace(self, workspace_id: str) -> dict:
         """Delete (permanently remove) a workspace/organization.
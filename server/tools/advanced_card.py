@@ -3,10 +3,11 @@ MCP tools for advanced card features.
 """
 
 from mcp.server.fastmcp import Context
-from server.trello import client
-validator = ValidationService(client)
+from server.trello import get_client
 from server.validators.validation_service import ValidationService
 
+client = get_client()
+validator = ValidationService(client)
 
 
 async def set_card_due_date(
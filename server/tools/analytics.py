@@ -1,16 +1,16 @@
 """
-from server.validators import ValidationService
 MCP tools for analytics and reporting.
 """
 
 import json
 from mcp.server.fastmcp import Context
-from server.trello import client
-nservice = AnalyticsService(client)
-validator = ValidationService(client)
 from server.services.analytics import AnalyticsService
-from server.validators.validation_service import ValidationService
+from server.trello import get_client
+from server.validators import ValidationService
 
+client = get_client()
+service = AnalyticsService(client)
+validator = ValidationService(client)
 
 
 async def get_board_statistics(ctx: Context, board_id: str) -> str:
@@ -11,11 +11,12 @@ from server.models import TrelloAttachment
 from server.dtos.attach_url import AttachUrlPayload
 from server.services.attachment import AttachmentService
 from server.validators import ValidationService
-from server.trello import client
+from server.trello import get_client
 from server.exceptions import TrelloMCPError
 
 logger = logging.getLogger(__name__)
 
+client = get_client()
 service = AttachmentService(client)
 validator = ValidationService(client)
 
@@ -4,13 +4,13 @@ MCP tools for batch operations.
 
 import json
 from mcp.server.fastmcp import Context
-from server.trello import client
+from server.services.batch import BatchService
+from server.trello import get_client
 from server.validators import ValidationService
 
+client = get_client()
 service = BatchService(client)
 validator = ValidationService(client)
-from server.services.batch import BatchService
-
 
 
 async def batch_get_resources(
@@ -29,9 +29,6 @@ async def batch_get_resources(
     Returns:
         JSON string containing array of responses
     """
-    client = client
-    # Using global service
-    
     # Split URLs
     url_list = [url.strip() for url in urls.split(",")]
     
@@ -39,6 +36,6 @@ async def batch_get_resources(
         return f"Error: Maximum 10 URLs allowed per batch request. You provided {len(url_list)}."
     
     # Execute batch
-    results = service.batch_get(url_list)
+    results = await service.batch_get(url_list)
     
     return f"Batch request completed for {len(url_list)} URLs. Results: {json.dumps(results)}"
@@ -13,11 +13,12 @@ from server.dtos.create_board import CreateBoardPayload
 from server.dtos.update_board import UpdateBoardPayload
 from server.services.board import BoardService
 from server.validators import ValidationService
-from server.trello import client
+from server.trello import get_client
 from server.exceptions import TrelloMCPError
 
 logger = logging.getLogger(__name__)
 
+client = get_client()
 service = BoardService(client)
 validator = ValidationService(client)
 
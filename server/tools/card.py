@@ -9,12 +9,13 @@ from mcp.server.fastmcp import Context
 
 from server.models import TrelloCard
 from server.services.card import CardService
-from server.trello import client
+from server.trello import get_client
 from server.dtos.update_card import UpdateCardPayload
 from server.dtos.create_card import CreateCardPayload
 
 logger = logging.getLogger(__name__)
 
+client = get_client()
 service = CardService(client)
 
 
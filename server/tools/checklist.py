@@ -6,9 +6,10 @@ import logging
 from typing import Dict, List
 
 from server.services.checklist import ChecklistService
-from server.trello import client
+from server.trello import get_client
 
 logger = logging.getLogger(__name__)
+client = get_client()
 service = ChecklistService(client)
 
 
@@ -12,11 +12,12 @@ from server.dtos.add_comment import AddCommentPayload
 from server.dtos.update_comment import UpdateCommentPayload
 from server.services.comment import CommentService
 from server.validators import ValidationService
-from server.trello import client
+from server.trello import get_client
 from server.exceptions import TrelloMCPError
 
 logger = logging.getLogger(__name__)
 
+client = get_client()
 service = CommentService(client)
 validator = ValidationService(client)
 
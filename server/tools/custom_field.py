@@ -7,8 +7,9 @@ from server.services.custom_field import CustomFieldService
 from server.dtos.create_custom_field import CreateCustomFieldPayload
 from server.dtos.set_custom_field_value import SetCustomFieldValuePayload
 from server.validators import ValidationService
-from server.trello import client
+from server.trello import get_client
 
+client = get_client()
 service = CustomFieldService(client)
 validator = ValidationService(client)
 
@@ -1,16 +1,16 @@
 """
-from server.validators import ValidationService
 MCP tools for export, import, and template operations.
 """
 
 import json
 from mcp.server.fastmcp import Context
-from server.trello import client
-nservice = ExportService(client)
-validator = ValidationService(client)
 from server.services.export import ExportService
-from server.validators.validation_service import ValidationService
+from server.trello import get_client
+from server.validators import ValidationService
 
+client = get_client()
+service = ExportService(client)
+validator = ValidationService(client)
 
 
 async def export_board(ctx: Context, board_id: str) -> str:
@@ -11,11 +11,12 @@ from server.models import TrelloLabel
 from server.dtos.update_label import UpdateLabelPayload
 from server.services.label import LabelService
 from server.validators import ValidationService
-from server.trello import client
+from server.trello import get_client
 from server.exceptions import TrelloMCPError
 
 logger = logging.getLogger(__name__)
 
+client = get_client()
 service = LabelService(client)
 validator = ValidationService(client)
 
@@ -10,11 +10,12 @@ from mcp.server.fastmcp import Context
 from server.models import TrelloList
 from server.services.list import ListService
 from server.validators import ValidationService
-from server.trello import client
+from server.trello import get_client
 from server.exceptions import TrelloMCPError
 
 logger = logging.getLogger(__name__)
 
+client = get_client()
 service = ListService(client)
 validator = ValidationService(client)
 
@@ -12,11 +12,12 @@ from server.dtos.add_board_member import AddBoardMemberPayload
 from server.dtos.update_board_member import UpdateBoardMemberPayload
 from server.services.member import MemberService
 from server.validators import ValidationService
-from server.trello import client
+from server.trello import get_client
 from server.exceptions import TrelloMCPError
 
 logger = logging.getLogger(__name__)
 
+client = get_client()
 service = MemberService(client)
 validator = ValidationService(client)
 
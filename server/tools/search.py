@@ -4,13 +4,13 @@ MCP tools for search operations.
 
 import json
 from mcp.server.fastmcp import Context
-from server.trello import client
+from server.services.search import SearchService
+from server.trello import get_client
 from server.validators import ValidationService
 
+client = get_client()
 service = SearchService(client)
 validator = ValidationService(client)
-from server.services.search import SearchService
-
 
 
 async def search_trello(
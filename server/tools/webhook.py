@@ -12,11 +12,12 @@ from server.dtos.create_webhook import CreateWebhookPayload
 from server.dtos.update_webhook import UpdateWebhookPayload
 from server.services.webhook import WebhookService
 from server.validators import ValidationService
-from server.trello import client
+from server.trello import get_client
 from server.exceptions import TrelloMCPError
 
 logger = logging.getLogger(__name__)
 
+client = get_client()
 service = WebhookService(client)
 validator = ValidationService(client)
 
@@ -31,13 +32,13 @@ async def create_webhook(ctx: Context, payload: CreateWebhookPayload) -> TrelloW
         TrelloWebhook: The created webhook object.
     """
     try:
-        logger.info(f"Creating webhook for model: {payload.id_model}")
+        logger.info("Creating webhook for model: %s", payload.id_model)
         
         # Convert payload to API parameters
         params = payload.to_api_params()
         
-        result = await service.create_webhook(**params)
-        logger.info(f"Successfully created webhook: {result.id}")
+        result = await service.create_webhook(params)
+        logger.info("Successfully created webhook: %s", result.id)
         return result
     except TrelloMCPError as e:
         error_msg = f"Failed to create webhook: {e.message}"
@@ -61,10 +62,10 @@ async def get_webhook(ctx: Context, webhook_id: str) -> TrelloWebhook:
         TrelloWebhook: The webhook object.
     """
     try:
-        logger.info(f"Getting webhook: {webhook_id}")
+        logger.info("Getting webhook: %s", webhook_id)
         
         result = await service.get_webhook(webhook_id)
-        logger.info(f"Successfully retrieved webhook: {webhook_id}")
+        logger.info("Successfully retrieved webhook: %s", webhook_id)
         return result
     except TrelloMCPError as e:
         error_msg = f"Failed to get webhook: {e.message}"
@@ -78,20 +79,30 @@ async def get_webhook(ctx: Context, webhook_id: str) -> TrelloWebhook:
         raise
 
 
-async def list_webhooks(ctx: Context, token: str) -> List[TrelloWebhook]:
+async def list_webhooks(
+    ctx: Context, token: str, stream: bool = False
+) -> List[TrelloWebhook]:
     """Retrieves all webhooks for a token.
 
     Args:
         token (str): The API token (use the token from environment or "me").
+        stream (bool): Decode the response incrementally and report progress per
+                       webhook. Useful for tokens with many webhooks. Defaults to False.
 
     Returns:
         List[TrelloWebhook]: A list of webhook objects.
     """
     try:
-        logger.info(f"Listing webhooks for token")
+        logger.info("Listing webhooks for token")
         
-        result = await service.list_webhooks(token)
-        logger.info(f"Successfully retrieved {len(result)} webhooks")
+        if stream:
+            result = []
+            async for webhook in service.stream_webhooks(token):
+                result.append(webhook)
+                await ctx.report_progress(len(result))
+        else:
+            result = await service.list_webhooks(token)
+        logger.info("Successfully retrieved %d webhooks", len(result))
         return result
     except TrelloMCPError as e:
         error_msg = f"Failed to list webhooks: {e.message}"
@@ -118,7 +129,7 @@ async def update_webhook(
         TrelloWebhook: The updated webhook object.
     """
     try:
-        logger.info(f"Updating webhook: {webhook_id}")
+        logger.info("Updating webhook: %s", webhook_id)
         
         # Convert payload to API parameters
         params = payload.to_api_params()
@@ -129,8 +140,8 @@ async def update_webhook(
             await ctx.error(error_msg)
             raise ValueError(error_msg)
         
-        result = await service.update_webhook(webhook_id, **params)
-        logger.info(f"Successfully updated webhook: {webhook_id}")
+        result = await service.update_webhook(webhook_id, params)
+        logger.info("Successfully updated webhook: %s", webhook_id)
         return result
     except TrelloMCPError as e:
         error_msg = f"Failed to update webhook: {e.message}"
@@ -154,10 +165,10 @@ async def delete_webhook(ctx: Context, webhook_id: str) -> dict:
         dict: Confirmation of deletion.
     """
     try:
-        logger.info(f"Deleting webhook: {webhook_id}")
+        logger.info("Deleting webhook: %s", webhook_id)
         
         await service.delete_webhook(webhook_id)
-        logger.info(f"Successfully deleted webhook: {webhook_id}")
+        logger.info("Successfully deleted webhook: %s", webhook_id)
         return {
             "success": True,
             "message": f"Webhook {webhook_id} deleted successfully"
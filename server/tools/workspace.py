@@ -2,6 +2,7 @@
 This module contains tools for managing Trello workspaces/organizations.
 """
 
+import asyncio
 import logging
 from typing import List
 
@@ -12,11 +13,12 @@ from server.dtos.create_workspace import CreateWorkspacePayload
 from server.dtos.update_workspace import UpdateWorkspacePayload
 from server.services.workspace import WorkspaceService
 from server.validators import ValidationService
-from server.trello import client
+from server.trello import get_client
 from server.exceptions import TrelloMCPError
 
 logger = logging.getLogger(__name__)
 
+client = get_client()
 service = WorkspaceService(client)
 validator = ValidationService(client)
 
@@ -30,7 +32,7 @@ async def get_workspaces(ctx: Context) -> List[TrelloOrganization]:
     try:
         logger.info("Getting all workspaces")
         result = await service.get_workspaces()
-        logger.info(f"Successfully retrieved {len(result)} workspaces")
+        logger.info("Successfully retrieved %d workspaces", len(result))
         return result
     except TrelloMCPError as e:
         error_msg = f"Failed to get workspaces: {e.message}"
@@ -54,13 +56,13 @@ async def get_workspace(ctx: Context, workspace_id: str) -> TrelloOrganization:
         TrelloOrganization: The workspace object containing workspace details.
     """
     try:
-        logger.info(f"Getting workspace with ID: {workspace_id}")
+        logger.info("Getting workspace with ID: %s", workspace_id)
         
-        # Validate workspace exists
+        # Validate workspace exists; the service call below reuses the cached response
         await validator.validate_organization_exists(workspace_id)
         
         result = await service.get_workspace(workspace_id)
-        logger.info(f"Successfully retrieved workspace: {workspace_id}")
+        logger.info("Successfully retrieved workspace: %s", workspace_id)
         return result
     except TrelloMCPError as e:
         error_msg = f"Failed to get workspace: {e.message}"
@@ -75,7 +77,7 @@ async def get_workspace(ctx: Context, workspace_id: str) -> TrelloOrganization:
 
 
 async def get_workspace_boards(
-    ctx: Context, workspace_id: str, filter_value: str = "all"
+    ctx: Context, workspace_id: str, filter_value: str = "all", stream: bool = False
 ) -> List[TrelloBoard]:
     """Retrieves all boards in a workspace/organization.
 
@@ -83,22 +85,37 @@ async def get_workspace_boards(
         workspace_id (str): The ID of the workspace whose boards to retrieve.
         filter_value (str): Filter for boards. Options: all, open, closed, members,
                           organization, public. Defaults to "all".
+        stream (bool): Decode the response incrementally and report progress per
+                       board. Useful for large workspaces. Defaults to False.
 
     Returns:
         List[TrelloBoard]: A list of board objects in the workspace.
     """
     try:
-        logger.info(f"Getting boards for workspace: {workspace_id} with filter: {filter_value}")
-        
-        # Validate workspace exists
-        await validator.validate_organization_exists(workspace_id)
+        logger.info(
+            "Getting boards for workspace: %s with filter: %s", workspace_id, filter_value
+        )
         
         # Validate filter value
         validator.validate_board_filter(filter_value)
         
-        result = await service.get_workspace_boards(workspace_id, filter_value)
+        if stream:
+            await validator.validate_organization_exists(workspace_id)
+            result = []
+            async for board in service.stream_workspace_boards(workspace_id, filter_value):
+                result.append(board)
+                await ctx.report_progress(len(result))
+        else:
+            # Reject a malformed ID before any request is queued, then check the
+            # workspace exists and fetch its boards in a single batched round-trip
+            validator.validate_id_format(workspace_id, "Organization")
+            async with client.batch():
+                _, result = await asyncio.gather(
+                    validator.validate_organization_exists(workspace_id),
+                    service.get_workspace_boards(workspace_id, filter_value),
+                )
         logger.info(
-            f"Successfully retrieved {len(result)} boards for workspace: {workspace_id}"
+            "Successfully retrieved %d boards for workspace: %s", len(result), workspace_id
         )
         return result
     except TrelloMCPError as e:
@@ -126,13 +143,15 @@ async def create_workspace(
         TrelloOrganization: The newly created workspace object.
     """
     try:
-        logger.info(f"Creating workspace: {payload.display_name}")
+        logger.info("Creating workspace: %s", payload.display_name)
         
         # Convert payload to API parameters
         params = payload.to_api_params()
         
-        result = await service.create_workspace(**params)
-        logger.info(f"Successfully created workspace: {result.id} - {result.displayName}")
+        result = await service.create_workspace(params)
+        logger.info(
+            "Successfully created workspace: %s - %s", result.id, result.displayName
+        )
         return result
     except TrelloMCPError as e:
         error_msg = f"Failed to create workspace: {e.message}"
@@ -159,7 +178,7 @@ async def update_workspace(
         TrelloOrganization: The updated workspace object.
     """
     try:
-        logger.info(f"Updating workspace: {workspace_id}")
+        logger.info("Updating workspace: %s", workspace_id)
         
         # Validate workspace exists
         await validator.validate_organization_exists(workspace_id)
@@ -167,8 +186,8 @@ async def update_workspace(
         # Convert payload to API parameters
         params = payload.to_api_params()
         
-        result = await service.update_workspace(workspace_id, **params)
-        logger.info(f"Successfully updated workspace: {workspace_id}")
+        result = await service.update_workspace(workspace_id, params)
+        logger.info("Successfully updated workspace: %s", workspace_id)
         return result
     except TrelloMCPError as e:
         error_msg = f"Failed to update workspace: {e.message}"
@@ -192,7 +211,7 @@ async def delete_workspace(ctx: Context, workspace_id: str) -> dict:
         dict: Confirmation of deletion.
     """
     try:
-        logger.info(f"Deleting workspace: {workspace_id}")
+        logger.info("Deleting workspace: %s", workspace_id)
         
         # Validate workspace exists
         await validator.validate_organization_exists(workspace_id)
@@ -201,7 +220,7 @@ async def delete_workspace(ctx: Context, workspace_id: str) -> dict:
         # The API will return 403 if user doesn't have permission
         
         result = await service.delete_workspace(workspace_id)
-        logger.info(f"Successfully deleted workspace: {workspace_id}")
+        logger.info("Successfully deleted workspace: %s", workspace_id)
         return {"success": True, "message": f"Workspace {workspace_id} has been permanently deleted"}
     except TrelloMCPError as e:
         error_msg = f"Failed to delete workspace: {e.message}"
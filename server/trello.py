@@ -1,5 +1,6 @@
 import logging
 import os
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -15,19 +16,34 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 
-# Initialize Trello client and service
-try:
-    api_key = os.getenv("TRELLO_API_KEY")
-    token = os.getenv("TRELLO_TOKEN")
-    if not api_key or not token:
-        raise ValueError(
-            "TRELLO_API_KEY and TRELLO_TOKEN must be set in environment variables"
-        )
-    client = TrelloClient(api_key=api_key, token=token)
-    logger.info("Trello client and service initialized successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize Trello client: {str(e)}")
-    raise
+# The process-wide Trello client; every tool module shares its connection pool.
+_client: Optional[TrelloClient] = None
+
+
+def get_client() -> TrelloClient:
+    """
+    Return the shared Trello client, creating it on first access.
+
+    Its lifetime is owned by the server entry point (see main.py), which
+    closes it on shutdown.
+    """
+    global _client
+    if _client is not None:
+        return _client
+
+    try:
+        api_key = os.getenv("TRELLO_API_KEY")
+        token = os.getenv("TRELLO_TOKEN")
+        if not api_key or not token:
+            raise ValueError(
+                "TRELLO_API_KEY and TRELLO_TOKEN must be set in environment variables"
+            )
+        _client = TrelloClient(api_key=api_key, token=token)
+        logger.info("Trello client and service initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize Trello client: {str(e)}")
+        raise
+    return _client
 
 
 # Add a prompt for common Trello operations
@@ -1,9 +1,23 @@
 # trello_api.py
 import asyncio
+import contextvars
 import logging
-from typing import Optional
+import math
+import os
+import random
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, AsyncIterator, NoReturn, Optional
+from urllib.parse import urlencode
 
 import httpx
+import ijson
+import orjson
+from aiolimiter import AsyncLimiter
+from pydantic import TypeAdapter
 
 from server.exceptions import (
     BadRequestError,
@@ -19,6 +33,53 @@ logger = logging.getLogger(__name__)
 
 TRELLO_API_BASE = "https://api.trello.com/1"
 
+CACHE_MAX_SIZE = 512
+BATCH_MAX_URLS = 10
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+# Pause new requests once Trello reports fewer than this many left in the window.
+RATE_LIMIT_LOW_WATER = 10
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(response_type) -> TypeAdapter:
+    """Build (once per type) the pydantic adapter used to parse typed responses."""
+    return TypeAdapter(response_type)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given as delay-seconds or an HTTP-date.
+
+    Returns the delay in seconds, or None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class _FetchAbandoned(Exception):
+    """Set on a single-flight Future when its leading request was cancelled."""
+
+
+# GETs issued inside ``TrelloClient.batch()`` are queued here and flushed together.
+_pending_batch: contextvars.ContextVar[Optional[list]] = contextvars.ContextVar(
+    "trello_pending_batch", default=None
+)
+
 
 class TrelloClient:
     """
@@ -31,14 +92,153 @@ class TrelloClient:
         self.token = token
         self.base_url = TRELLO_API_BASE
         self.max_retries = max_retries
-        self.client = httpx.AsyncClient(base_url=self.base_url, timeout=30.0)
+
+        # Keep a wide pool of keep-alive connections and multiplex over HTTP/2 so
+        # bursts of concurrent tool calls don't pay a fresh TCP+TLS handshake each.
+        limits = httpx.Limits(
+            max_connections=int(os.getenv("TRELLO_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("TRELLO_MAX_KEEPALIVE", "20")),
+            keepalive_expiry=30.0,
+        )
+        timeout = httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=5.0)
+        # Auth is sent as default query params; httpx merges per-request params in.
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            params={"key": api_key, "token": token},
+            limits=limits,
+            timeout=timeout,
+            http2=True,
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        # Admission control: cap the number of requests in flight at once.
+        # The semaphore is created lazily so it binds to the running event loop.
+        self._concurrency = int(os.getenv("TRELLO_CONCURRENCY", "8"))
+        self._sem: Optional[asyncio.Semaphore] = None
+
+        # Trello allows 100 requests / 10s per API key and 10 requests / 10s per
+        # token; stay slightly below both so bursts are paced instead of rejected.
+        # Raise these if Trello has granted this key or token a higher quota.
+        self._key_limiter = AsyncLimiter(float(os.getenv("TRELLO_KEY_RATE", "95")), 10)
+        self._token_limiter = AsyncLimiter(float(os.getenv("TRELLO_TOKEN_RATE", "9")), 10)
+        self._paused_until = 0.0
+        # Latest X-Rate-Limit-*-Remaining values reported by Trello (None until seen).
+        self._rl_key_remaining: Optional[int] = None
+        self._rl_token_remaining: Optional[int] = None
+
+        # Short-lived, per-process cache of GET responses keyed by (endpoint, params),
+        # storing (stored_at, etag, raw body bytes). Bodies are decoded per call so
+        # callers never share mutable objects and typed callers can parse directly.
+        # Expired entries with an ETag are revalidated with If-None-Match.
+        # Mutating requests evict related entries.
+        self._cache: dict[tuple, tuple[float, Optional[str], bytes]] = {}
+        self._cache_ttl = float(os.getenv("TRELLO_CACHE_TTL", "30"))
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        # Bumped by every write so a GET that overlapped it won't cache its body.
+        self._generation = 0
+        # Strong references to pending /batch flushes so they aren't GC'd mid-flight.
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
 
     async def close(self):
+        """Close the underlying connection pool. Safe to call more than once."""
+        if self.client.is_closed:
+            return
         await self.client.aclose()
 
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Return the request semaphore, creating it on first use."""
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self._concurrency)
+        return self._sem
+
+    def _pause(self, delay: float) -> None:
+        """Stop issuing new requests for ``delay`` seconds."""
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def _track_rate_limit(self, headers: httpx.Headers) -> None:
+        """
+        Record Trello's reported remaining quota and pause early when it runs low.
+
+        This also catches quota used by other processes sharing the same key
+        or token, which the local limiters cannot see.
+        """
+        for scope in ("Key", "Token"):
+            remaining = headers.get(f"X-Rate-Limit-Api-{scope}-Remaining")
+            if remaining is None or not remaining.isdigit():
+                continue
+            remaining = int(remaining)
+            if scope == "Key":
+                self._rl_key_remaining = remaining
+            else:
+                self._rl_token_remaining = remaining
+            if remaining < RATE_LIMIT_LOW_WATER:
+                interval_ms = headers.get(f"X-Rate-Limit-Api-{scope}-Interval-Ms", "10000")
+                delay = int(interval_ms) / 1000 if interval_ms.isdigit() else 10.0
+                logger.warning(
+                    "Trello API %s quota low (%d remaining); pausing for %.1f seconds",
+                    scope.lower(),
+                    remaining,
+                    delay,
+                )
+                self._pause(delay)
+
+    async def _acquire_rate_limit(self) -> None:
+        """Wait until both rate-limit buckets allow another request."""
+        wait = self._paused_until - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        await self._key_limiter.acquire()
+        await self._token_limiter.acquire()
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[dict]) -> tuple:
+        return (endpoint, tuple(sorted((params or {}).items())))
+
+    def _cache_get(self, key: tuple) -> Optional[tuple[float, Optional[str], bytes]]:
+        """Return the cached ``(stored_at, etag, value)`` entry for ``key``, if any."""
+        return self._cache.get(key)
+
+    def _is_fresh(self, entry: tuple[float, Optional[str], bytes]) -> bool:
+        return time.monotonic() - entry[0] < self._cache_ttl
+
+    def _cache_set(self, key: tuple, etag: Optional[str], value: bytes) -> None:
+        if self._cache_ttl <= 0:
+            return
+        self._cache.pop(key, None)
+        if len(self._cache) >= CACHE_MAX_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic(), etag, value)
+
+    def _invalidate(self, endpoint: str) -> None:
+        """
+        Drop cached GETs that may be stale after a write to ``endpoint``.
+
+        A write to ``/webhooks/{id}`` evicts every cached path mentioning
+        ``webhooks`` (e.g. ``/tokens/{token}/webhooks``) or that id. Matching
+        in-flight GETs are detached so later readers start a fresh request.
+        """
+        self._generation += 1
+        parts = [p for p in endpoint.strip("/").split("/")[:2] if p]
+        if not parts:
+            return
+
+        def is_stale(key: tuple) -> bool:
+            return any(part in key[0].strip("/").split("/") for part in parts)
+
+        for store in (self._cache, self._inflight):
+            for key in [key for key in store if is_stale(key)]:
+                del store[key]
+
     def _handle_http_error(
         self, error: httpx.HTTPStatusError, endpoint: str, method: str
-    ):
+    ) -> NoReturn:
         """
         Handle HTTP errors with specific exception types based on status code.
 
@@ -54,7 +254,7 @@ class TrelloClient:
         response_text = error.response.text
 
         logger.error(
-            f"HTTP {status_code} error for {method} {endpoint}: {response_text}"
+            "HTTP %s error for %s %s: %s", status_code, method, endpoint, response_text
         )
 
         if status_code == 400:
@@ -66,14 +266,18 @@ class TrelloClient:
         elif status_code == 403:
             raise ForbiddenError("Resource", endpoint, "access")
         elif status_code == 404:
-            # Extract resource type from endpoint
-            resource_type = endpoint.split("/")[1].rstrip("s").capitalize()
-            resource_id = endpoint.split("/")[2] if len(endpoint.split("/")) > 2 else "unknown"
+            # Extract resource type and ID from endpoint with a single split,
+            # tolerating a missing leading slash or an explicit "/1" version prefix
+            path = endpoint.lstrip("/")
+            if path.startswith("1/"):
+                path = path[2:]
+            parts = path.split("/", 2)
+            resource_type = parts[0].rstrip("s").capitalize() if parts[0] else "Resource"
+            resource_id = parts[1] if len(parts) > 1 and parts[1] else "unknown"
             raise ResourceNotFoundError(resource_type, resource_id)
         elif status_code == 429:
-            retry_after = error.response.headers.get("Retry-After")
             raise RateLimitError(
-                retry_after=int(retry_after) if retry_after else None
+                retry_after=_parse_retry_after(error.response.headers.get("Retry-After"))
             )
         else:
             raise TrelloMCPError(
@@ -87,145 +291,380 @@ class TrelloClient:
         endpoint: str,
         params: Optional[dict] = None,
         data: Optional[dict] = None,
+        response_type: Any = None,
     ):
         """
-        Execute a request with exponential backoff retry for rate limits.
+        Execute a request with jittered backoff retry for rate limits.
+
+        GET responses are served from a short-lived in-process cache when
+        possible. Once an entry expires it is revalidated with ``If-None-Match``
+        and reused on ``304 Not Modified``. Concurrent identical GETs share a
+        single in-flight request. Successful writes invalidate related cache
+        entries.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint
             params: Query parameters
             data: Request body data
+            response_type: Optional type (e.g. ``List[TrelloBoard]``) to parse
+                the body into directly instead of returning plain JSON
 
         Returns:
-            Response JSON
+            Response JSON, or an instance of ``response_type``
 
         Raises:
             TrelloMCPError or subclass on failure
         """
-        base_delay = 1
+        if method == "GET":
+            cache_key = self._cache_key(endpoint, params)
+            entry = self._cache_get(cache_key)
+            if entry is not None and self._is_fresh(entry):
+                return self._decode(entry[2], response_type)
+
+            # Single-flight: identical GETs already on the wire share one result.
+            # If the request being awaited is abandoned because its caller was
+            # cancelled, loop so one follower takes over the fetch.
+            while (inflight := self._inflight.get(cache_key)) is not None:
+                try:
+                    body = await asyncio.shield(inflight)
+                except _FetchAbandoned:
+                    continue
+                return self._decode(body, response_type)
+
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[cache_key] = future
+            try:
+                body = await self._fetch(cache_key, entry, endpoint, params)
+            except BaseException as e:
+                # Only this caller was cancelled; followers must not inherit that.
+                future.set_exception(
+                    _FetchAbandoned() if isinstance(e, asyncio.CancelledError) else e
+                )
+                # Mark retrieved; waiters still see it when they await.
+                future.exception()
+                raise
+            else:
+                future.set_result(body)
+                return self._decode(body, response_type)
+            finally:
+                # A write may already have detached this entry (see _invalidate).
+                if self._inflight.get(cache_key) is future:
+                    del self._inflight[cache_key]
+
+        response = await self._send_with_retry(method, endpoint, params, data)
+        self._invalidate(endpoint)
+        return self._decode(response.content, response_type)
+
+    async def _fetch(
+        self,
+        cache_key: tuple,
+        entry: Optional[tuple[float, Optional[str], bytes]],
+        endpoint: str,
+        params: Optional[dict],
+    ) -> bytes:
+        """
+        Fetch a GET body from the network (or a pending batch) and cache it.
+
+        The body is not cached if a write completed while it was in flight,
+        since it may predate that write.
+        """
+        generation = self._generation
+        pending = _pending_batch.get()
+        if pending is not None:
+            item = await self._enqueue_batched(pending, endpoint, params)
+            body = orjson.dumps(item)
+            if self._generation == generation:
+                self._cache_set(cache_key, None, body)
+            return body
+
+        headers = {"If-None-Match": entry[1]} if entry is not None and entry[1] else None
+        response = await self._send_with_retry("GET", endpoint, params, headers=headers)
+        etag = response.headers.get("ETag")
+        if response.status_code == 304 and entry is not None:
+            # A 304 need not repeat the ETag; keep the validator we sent.
+            body = entry[2]
+            etag = etag or entry[1]
+        else:
+            body = response.content
+        if self._generation == generation:
+            self._cache_set(cache_key, etag, body)
+        return body
+
+    @staticmethod
+    def _backoff(last_delay: float) -> float:
+        """
+        Next retry delay using decorrelated jitter.
+
+        Randomising each delay keeps concurrent clients from retrying in lockstep.
+        """
+        return random.uniform(RETRY_BASE_DELAY, min(RETRY_MAX_DELAY, last_delay * 3))
+
+    async def _send_with_retry(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> httpx.Response:
+        """Run the retry loop for a single request, bypassing the cache."""
+        last_delay = RETRY_BASE_DELAY
+        sem = self._semaphore()
 
         for attempt in range(self.max_retries):
             try:
-                if method == "GET":
-                    return await self._get(endpoint, params)
-                elif method == "POST":
-                    return await self._post(endpoint, params, data)
-                elif method == "PUT":
-                    return await self._put(endpoint, params, data)
-                elif method == "DELETE":
-                    return await self._delete(endpoint, params)
+                await self._acquire_rate_limit()
+                # Only the HTTP call holds a slot; backoff sleeps happen after release.
+                async with sem:
+                    try:
+                        return await self._do(method, endpoint, params, data, headers)
+                    except httpx.HTTPStatusError as e:
+                        # The only place HTTP errors become TrelloMCPError subclasses.
+                        self._handle_http_error(e, endpoint, method)
             except RateLimitError as e:
                 if attempt == self.max_retries - 1:
-                    logger.error(f"Max retries exceeded for {method} {endpoint}")
+                    logger.error("Max retries exceeded for %s %s", method, endpoint)
                     raise
 
-                delay = e.retry_after or (base_delay * (2**attempt))
+                # Retry-After is a floor: never retry sooner than Trello asked.
+                delay = max(e.retry_after or 0, self._backoff(last_delay))
+                last_delay = delay
+                # Hold back every other caller too, not just this retry.
+                self._pause(delay)
                 logger.warning(
-                    f"Rate limit hit on attempt {attempt + 1}/{self.max_retries}. "
-                    f"Retrying in {delay} seconds..."
+                    "Rate limit hit on attempt %d/%d. Retrying in %.2f seconds...",
+                    attempt + 1,
+                    self.max_retries,
+                    delay,
                 )
                 await asyncio.sleep(delay)
             except (httpx.RequestError, httpx.TimeoutException) as e:
                 if attempt == self.max_retries - 1:
-                    logger.error(f"Max retries exceeded for {method} {endpoint}")
+                    logger.error("Max retries exceeded for %s %s", method, endpoint)
                     raise TrelloMCPError(
                         f"Network error after {self.max_retries} attempts: {str(e)}"
                     )
 
-                delay = base_delay * (2**attempt)
+                delay = self._backoff(last_delay)
+                last_delay = delay
                 logger.warning(
-                    f"Network error on attempt {attempt + 1}/{self.max_retries}. "
-                    f"Retrying in {delay} seconds... Error: {str(e)}"
+                    "Network error on attempt %d/%d. Retrying in %.2f seconds... Error: %s",
+                    attempt + 1,
+                    self.max_retries,
+                    delay,
+                    e,
                 )
                 await asyncio.sleep(delay)
 
         raise TrelloMCPError(f"Max retries exceeded for {method} {endpoint}")
 
-    async def _get(self, endpoint: str, params: Optional[dict] = None):
-        """Internal GET method without retry logic."""
-        all_params = {"key": self.api_key, "token": self.token}
-        if params:
-            all_params.update(params)
+    async def _do(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> httpx.Response:
+        """
+        Internal request method without retry logic.
 
-        try:
-            response = await self.client.get(endpoint, params=all_params)
+        Returns the raw response so callers can read headers; a ``304 Not
+        Modified`` is returned as-is rather than raised. HTTP and network
+        errors propagate to ``_send_with_retry``.
+        """
+        content = None
+        if data is not None:
+            content = orjson.dumps(data)
+            headers = {**JSON_HEADERS, **headers} if headers else JSON_HEADERS
+        response = await self.client.request(
+            method, endpoint, params=params, content=content, headers=headers
+        )
+        if response.status_code != 304:
             response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            self._handle_http_error(e, endpoint, "GET")
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
-            raise
-
-    async def _post(
-        self, endpoint: str, params: Optional[dict] = None, data: Optional[dict] = None
-    ):
-        """Internal POST method without retry logic."""
-        all_params = {"key": self.api_key, "token": self.token}
-        if params:
-            all_params.update(params)
+        self._track_rate_limit(response.headers)
+        return response
 
-        try:
-            response = await self.client.post(endpoint, params=all_params, json=data)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            self._handle_http_error(e, endpoint, "POST")
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
-            raise
-
-    async def _put(
-        self, endpoint: str, params: Optional[dict] = None, data: Optional[dict] = None
-    ):
-        """Internal PUT method without retry logic."""
-        all_params = {"key": self.api_key, "token": self.token}
-        if params:
-            all_params.update(params)
+    @staticmethod
+    def _decode(content: bytes, response_type: Any = None):
+        """
+        Decode a JSON response body.
 
-        try:
-            response = await self.client.put(endpoint, params=all_params, json=data)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            self._handle_http_error(e, endpoint, "PUT")
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
-            raise
-
-    async def _delete(self, endpoint: str, params: Optional[dict] = None):
-        """Internal DELETE method without retry logic."""
-        all_params = {"key": self.api_key, "token": self.token}
-        if params:
-            all_params.update(params)
+        With a ``response_type`` the bytes are parsed and validated in a single
+        pydantic-core pass, skipping the intermediate dicts; otherwise orjson is
+        used to return plain JSON.
+        """
+        if response_type is not None:
+            return _type_adapter(response_type).validate_json(content)
+        return orjson.loads(content)
+
+    async def batch_get(self, urls: list[str]) -> list:
+        """
+        Execute several GET routes through Trello's ``/batch`` endpoint.
+
+        Routes are sent in chunks of ``BATCH_MAX_URLS``. Each route must start
+        with ``/`` and omit the API version, e.g. ``/boards/{id}``.
 
+        Args:
+            urls: Relative API routes to fetch
+
+        Returns:
+            One entry per route, in order: the response body on success, or
+            the error object Trello returned for that route
+        """
+        results = []
+        for start in range(0, len(urls), BATCH_MAX_URLS):
+            chunk = urls[start : start + BATCH_MAX_URLS]
+            # Bypass GET() so the call is neither cached nor re-queued into a batch.
+            response = await self._send_with_retry(
+                "GET", "/batch", params={"urls": ",".join(chunk)}
+            )
+            for item in self._decode(response.content):
+                # Successful routes are wrapped as {"200": body}
+                results.append(item.get("200", item) if isinstance(item, dict) else item)
+        return results
+
+    @asynccontextmanager
+    async def batch(self):
+        """
+        Coalesce GETs issued concurrently inside this block into ``/batch`` calls.
+
+        GETs started together (e.g. via ``asyncio.gather``) are flushed as one
+        request on the next event-loop tick; a lone awaited GET still works,
+        it is simply sent as a batch of one.
+        """
+        if _pending_batch.get() is not None:
+            yield self
+            return
+        reset = _pending_batch.set([])
         try:
-            response = await self.client.delete(endpoint, params=all_params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            self._handle_http_error(e, endpoint, "DELETE")
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
-            raise
+            yield self
+        finally:
+            _pending_batch.reset(reset)
+
+    async def _enqueue_batched(self, pending: list, endpoint: str, params: Optional[dict]):
+        url = f"{endpoint}?{urlencode(params)}" if params else endpoint
+        future = asyncio.get_running_loop().create_future()
+        pending.append((url, endpoint, future))
+        if len(pending) == 1:
+            task = asyncio.get_running_loop().create_task(self._flush_batch(pending))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        return await future
+
+    async def _flush_batch(self, pending: list) -> None:
+        queued = pending
+        try:
+            # Yield once so every GET started in the same tick joins this batch.
+            await asyncio.sleep(0)
+            queued = pending[:]
+            pending.clear()
+
+            try:
+                results = await self.batch_get([url for url, _, _ in queued])
+            except Exception as e:
+                for _, _, future in queued:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            for (url, endpoint, future), item in zip(queued, results):
+                if future.done():
+                    continue
+                status_code = item.get("statusCode") if isinstance(item, dict) else None
+                if status_code and status_code >= 400:
+                    # Translate per-route failures exactly like direct requests.
+                    response = httpx.Response(
+                        status_code, json=item, request=httpx.Request("GET", url)
+                    )
+                    try:
+                        self._handle_http_error(
+                            httpx.HTTPStatusError("", request=response.request, response=response),
+                            endpoint,
+                            "GET",
+                        )
+                    except Exception as e:
+                        future.set_exception(e)
+                else:
+                    future.set_result(item)
+        finally:
+            # If the flush was cancelled (or /batch returned too few items),
+            # don't leave any queued GET waiting forever.
+            for _, _, future in queued:
+                if not future.done():
+                    future.cancel()
+            if queued is pending:
+                pending.clear()
+
+    async def stream_get(
+        self, endpoint: str, params: Optional[dict] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Stream the items of a JSON array response as they arrive.
+
+        The body is decoded incrementally, so large lists (boards, webhooks)
+        never sit in memory as one buffer and the first item is available
+        before the download finishes. Streamed GETs are rate limited like any
+        other request but bypass the cache and are not retried, since a
+        partially consumed stream cannot be replayed.
+
+        Args:
+            endpoint: API endpoint returning a JSON array
+            params: Query parameters
+
+        Yields:
+            Each decoded array element
+        """
+        await self._acquire_rate_limit()
+        async with self._semaphore():
+            async with self.client.stream("GET", endpoint, params=params) as response:
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPStatusError as e:
+                    await response.aread()
+                    self._handle_http_error(e, endpoint, "GET")
+                self._track_rate_limit(response.headers)
+
+                items = ijson.sendable_list()
+                parser = ijson.items_coro(items, "item", use_float=True)
+                async for chunk in response.aiter_bytes():
+                    parser.send(chunk)
+                    for item in items:
+                        yield item
+                    del items[:]
+                parser.close()
+                for item in items:
+                    yield item
 
     # Public methods with retry logic
-    async def GET(self, endpoint: str, params: Optional[dict] = None):
+    async def GET(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        response_type: Any = None,
+    ):
         """
         Execute a GET request with retry logic.
 
         Args:
             endpoint: API endpoint
             params: Query parameters
+            response_type: Optional type to parse the response into
 
         Returns:
-            Response JSON
+            Response JSON, or an instance of ``response_type``
         """
-        return await self._request_with_retry("GET", endpoint, params=params)
+        return await self._request_with_retry(
+            "GET", endpoint, params=params, response_type=response_type
+        )
 
     async def POST(
-        self, endpoint: str, data: Optional[dict] = None, params: Optional[dict] = None
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        params: Optional[dict] = None,
+        response_type: Any = None,
     ):
         """
         Execute a POST request with retry logic.
@@ -234,14 +673,21 @@ class TrelloClient:
             endpoint: API endpoint
             data: Request body data
             params: Query parameters
+            response_type: Optional type to parse the response into
 
         Returns:
-            Response JSON
+            Response JSON, or an instance of ``response_type``
         """
-        return await self._request_with_retry("POST", endpoint, params=params, data=data)
+        return await self._request_with_retry(
+            "POST", endpoint, params=params, data=data, response_type=response_type
+        )
 
     async def PUT(
-        self, endpoint: str, data: Optional[dict] = None, params: Optional[dict] = None
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        params: Optional[dict] = None,
+        response_type: Any = None,
     ):
         """
         Execute a PUT request with retry logic.
@@ -250,11 +696,14 @@ class TrelloClient:
             endpoint: API endpoint
             data: Request body data
             params: Query parameters
+            response_type: Optional type to parse the response into
 
         Returns:
-            Response JSON
+            Response JSON, or an instance of ``response_type``
         """
-        return await self._request_with_retry("PUT", endpoint, params=params, data=data)
+        return await self._request_with_retry(
+            "PUT", endpoint, params=params, data=data, response_type=response_type
+        )
 
     async def DELETE(self, endpoint: str, params: Optional[dict] = None):
         """
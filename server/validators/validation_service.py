@@ -158,7 +158,9 @@ class ValidationService:
 
         try:
             logger.debug(f"Validating organization exists: {org_id}")
-            await self.client.GET(f"/organizations/{org_id}", params={"fields": "id"})
+            # Fetch the same route as WorkspaceService.get_workspace so the client's
+            # GET cache lets a following get/update/delete reuse this response.
+            await self.client.GET(f"/organizations/{org_id}")
             logger.debug(f"Organization {org_id} exists and is accessible")
             return True
         except httpx.HTTPStatusError as e:
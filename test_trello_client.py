@@ -0,0 +1,541 @@
+"""
+Test script for TrelloClient request handling (caching, pacing, errors).
+Runs offline by stubbing the client's internal send step.
+"""
+
+import sys
+import os
+import asyncio
+
+# Set dummy environment variables for testing
+os.environ["TRELLO_API_KEY"] = "test_api_key_for_testing_only"
+os.environ["TRELLO_TOKEN"] = "test_token_for_testing_only"
+
+
+def make_client(etag=None):
+    """Create a TrelloClient whose network calls are recorded instead of sent."""
+    import httpx
+    from server.utils.trello_api import TrelloClient
+
+    client = TrelloClient(api_key="key", token="token")
+    calls = []
+
+    async def fake_send(method, endpoint, params=None, data=None, headers=None):
+        calls.append((method, endpoint, params, headers))
+        # Yield like a real request so concurrent callers interleave
+        await asyncio.sleep(0)
+        if endpoint == "/batch":
+            urls = params["urls"].split(",")
+            return httpx.Response(200, json=[{"200": {"url": url}} for url in urls])
+        if etag and headers and headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        response_headers = {"ETag": etag} if etag else {}
+        return httpx.Response(
+            200, json={"id": "abc", "endpoint": endpoint}, headers=response_headers
+        )
+
+    client._send_with_retry = fake_send
+    return client, calls
+
+
+def test_get_cache():
+    """Test that repeated GETs are served from the cache."""
+    print("Testing GET cache...")
+
+    async def run():
+        client, calls = make_client()
+        first = await client.GET("/webhooks/abc")
+        second = await client.GET("/webhooks/abc")
+        assert first == second
+        assert len(calls) == 1
+
+        # Different params are a different cache entry
+        await client.GET("/webhooks/abc", params={"fields": "id"})
+        assert len(calls) == 2
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ Repeated GETs hit the cache")
+        return True
+    except Exception as e:
+        print(f"✗ GET cache test failed: {e}")
+        return False
+
+
+def test_cache_invalidation():
+    """Test that writes evict related cached GETs."""
+    print("\nTesting cache invalidation...")
+
+    async def run():
+        client, calls = make_client()
+        await client.GET("/webhooks/abc")
+        await client.GET("/tokens/token/webhooks")
+        await client.GET("/boards/xyz")
+        assert len(calls) == 3
+
+        await client.DELETE("/webhooks/abc")
+        await client.GET("/webhooks/abc")
+        await client.GET("/tokens/token/webhooks")
+        await client.GET("/boards/xyz")
+        # Both webhook entries were refetched, the board was not
+        assert len(calls) == 6
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ Writes invalidate related cache entries")
+        return True
+    except Exception as e:
+        print(f"✗ Cache invalidation test failed: {e}")
+        return False
+
+
+def test_etag_revalidation():
+    """Test that expired entries are revalidated with If-None-Match."""
+    print("\nTesting ETag revalidation...")
+
+    async def run():
+        import httpx
+
+        client, calls = make_client(etag='"v1"')
+        client._cache_ttl = 0.01
+        first = await client.GET("/organizations/abc")
+        await asyncio.sleep(0.02)
+        second = await client.GET("/organizations/abc")
+        assert second == first
+        assert len(calls) == 2
+        assert calls[1][3] == {"If-None-Match": '"v1"'}
+
+        # A 304 without an ETag header must keep the stored validator
+        async def bare_304(method, endpoint, params=None, data=None, headers=None):
+            calls.append((method, endpoint, params, headers))
+            return httpx.Response(304)
+
+        client._send_with_retry = bare_304
+        await asyncio.sleep(0.02)
+        assert await client.GET("/organizations/abc") == first
+        await asyncio.sleep(0.02)
+        assert await client.GET("/organizations/abc") == first
+        assert calls[3][3] == {"If-None-Match": '"v1"'}
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ 304 responses reuse the cached body")
+        return True
+    except Exception as e:
+        print(f"✗ ETag revalidation test failed: {e}")
+        return False
+
+
+def test_batch_coalescing():
+    """Test that concurrent GETs inside batch() share one /batch request."""
+    print("\nTesting batch coalescing...")
+
+    async def run():
+        client, calls = make_client()
+        async with client.batch():
+            org, boards = await asyncio.gather(
+                client.GET("/organizations/abc"),
+                client.GET("/organizations/abc/boards", params={"filter": "all"}),
+            )
+        assert len(calls) == 1
+        assert calls[0][1] == "/batch"
+        assert org == {"url": "/organizations/abc"}
+        assert boards == {"url": "/organizations/abc/boards?filter=all"}
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ Concurrent GETs coalesced into one /batch call")
+        return True
+    except Exception as e:
+        print(f"✗ Batch coalescing test failed: {e}")
+        return False
+
+
+def test_batch_flush_cancelled():
+    """Test that cancelling a /batch flush releases the GETs queued on it."""
+    print("\nTesting batch flush cancellation...")
+
+    async def run():
+        client, calls = make_client()
+
+        async def hang(method, endpoint, params=None, data=None, headers=None):
+            calls.append((method, endpoint, params, headers))
+            await asyncio.Event().wait()
+
+        client._send_with_retry = hang
+        async with client.batch():
+            gets = asyncio.gather(
+                client.GET("/organizations/abc"),
+                client.GET("/organizations/abc/boards"),
+                return_exceptions=True,
+            )
+            await asyncio.sleep(0.01)
+            assert len(client._flush_tasks) == 1
+            for task in list(client._flush_tasks):
+                task.cancel()
+            results = await asyncio.wait_for(gets, timeout=1)
+        assert all(isinstance(r, asyncio.CancelledError) for r in results), results
+        assert not client._flush_tasks
+        assert not client._inflight
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ Queued GETs are cancelled with their flush")
+        return True
+    except (Exception, asyncio.CancelledError) as e:
+        print(f"✗ Batch flush cancellation test failed: {e!r}")
+        return False
+
+
+def test_single_flight():
+    """Test that concurrent identical GETs share one request."""
+    print("\nTesting single-flight deduplication...")
+
+    async def run():
+        client, calls = make_client()
+        results = await asyncio.gather(
+            client.GET("/webhooks/abc"),
+            client.GET("/webhooks/abc"),
+            client.GET("/webhooks/abc"),
+        )
+        assert all(result == results[0] for result in results)
+        assert len(calls) == 1
+        assert not client._inflight
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ Concurrent identical GETs deduplicated")
+        return True
+    except Exception as e:
+        print(f"✗ Single-flight test failed: {e}")
+        return False
+
+
+def test_single_flight_leader_cancelled():
+    """Test that cancelling the leading GET does not cancel its followers."""
+    print("\nTesting single-flight leader cancellation...")
+
+    async def run():
+        import httpx
+
+        client, calls = make_client()
+        release = asyncio.Event()
+
+        async def slow_send(method, endpoint, params=None, data=None, headers=None):
+            calls.append((method, endpoint, params, headers))
+            await release.wait()
+            return httpx.Response(200, json={"id": "abc"})
+
+        client._send_with_retry = slow_send
+        leader = asyncio.create_task(client.GET("/webhooks/abc"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(client.GET("/webhooks/abc"))
+        await asyncio.sleep(0)
+        assert len(calls) == 1
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        result = await follower
+        assert leader.cancelled()
+        assert not follower.cancelled()
+        assert result == {"id": "abc"}
+        # The follower took over and made its own request
+        assert len(calls) == 2
+        assert not client._inflight
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ Followers survive a cancelled leader")
+        return True
+    except (Exception, asyncio.CancelledError) as e:
+        print(f"✗ Leader cancellation test failed: {e!r}")
+        return False
+
+
+def test_write_during_inflight_get():
+    """Test that a GET overlapping a write is neither cached nor joined."""
+    print("\nTesting writes during in-flight GETs...")
+
+    async def run():
+        import httpx
+
+        client, calls = make_client()
+        release = asyncio.Event()
+        version = {"v": 1}
+
+        async def send(method, endpoint, params=None, data=None, headers=None):
+            calls.append((method, endpoint, params, headers))
+            if method == "GET":
+                body = dict(version)
+                await release.wait()
+                return httpx.Response(200, json=body)
+            version["v"] = 2
+            return httpx.Response(200, json={})
+
+        client._send_with_retry = send
+        stale = asyncio.create_task(client.GET("/webhooks/abc"))
+        await asyncio.sleep(0)
+        await client.PUT("/webhooks/abc", data={"active": False})
+
+        # A GET after the write must not join the pre-write request
+        fresh = asyncio.create_task(client.GET("/webhooks/abc"))
+        await asyncio.sleep(0)
+        release.set()
+        assert await stale == {"v": 1}
+        assert await fresh == {"v": 2}
+        # ...and the pre-write body must not have been cached
+        assert await client.GET("/webhooks/abc") == {"v": 2}
+        assert len(calls) == 3
+        assert not client._inflight
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ Writes detach in-flight GETs and skip caching their bodies")
+        return True
+    except Exception as e:
+        print(f"✗ Write during in-flight GET test failed: {e!r}")
+        return False
+
+
+def test_not_found_parsing():
+    """Test that 404s name the resource regardless of endpoint shape."""
+    print("\nTesting 404 resource parsing...")
+
+    import httpx
+    from server.exceptions import ResourceNotFoundError
+    from server.utils.trello_api import TrelloClient
+
+    client = TrelloClient(api_key="key", token="token")
+    try:
+        for endpoint in ["/boards/abc/lists", "boards/abc", "/1/boards/abc"]:
+            request = httpx.Request("GET", "https://api.trello.com/1" + endpoint)
+            response = httpx.Response(404, text="not found", request=request)
+            error = httpx.HTTPStatusError("", request=request, response=response)
+            try:
+                client._handle_http_error(error, endpoint, "GET")
+            except ResourceNotFoundError as e:
+                assert "Board" in e.message and "abc" in e.message, e.message
+        print("✓ 404 errors report the right resource type and ID")
+        return True
+    except Exception as e:
+        print(f"✗ 404 parsing test failed: {e}")
+        return False
+
+
+def test_validator_shares_cache():
+    """Test that organization validation and retrieval share one request."""
+    print("\nTesting validator cache sharing...")
+
+    async def run():
+        from server.services.workspace import WorkspaceService
+        from server.validators import ValidationService
+
+        client, calls = make_client()
+        org = {"id": "a" * 24, "name": "org", "displayName": "Org", "url": "https://trello.com"}
+
+        async def fake_send(method, endpoint, params=None, data=None, headers=None):
+            import httpx
+            calls.append((method, endpoint, params, headers))
+            return httpx.Response(200, json=org)
+
+        client._send_with_retry = fake_send
+        await ValidationService(client).validate_organization_exists(org["id"])
+        result = await WorkspaceService(client).get_workspace(org["id"])
+        assert result.id == org["id"]
+        assert len(calls) == 1
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ Validation and retrieval made a single API call")
+        return True
+    except Exception as e:
+        print(f"✗ Validator cache sharing test failed: {e}")
+        return False
+
+
+def test_rate_limit_headers():
+    """Test that low X-Rate-Limit remaining values pause new requests."""
+    print("\nTesting rate-limit header pacing...")
+
+    import time
+    import httpx
+    from server.utils.trello_api import TrelloClient
+
+    client = TrelloClient(api_key="key", token="token")
+    try:
+        client._track_rate_limit(httpx.Headers({"X-Rate-Limit-Api-Key-Remaining": "50"}))
+        assert client._rl_key_remaining == 50
+        assert client._paused_until <= time.monotonic()
+
+        client._track_rate_limit(
+            httpx.Headers(
+                {
+                    "X-Rate-Limit-Api-Token-Remaining": "2",
+                    "X-Rate-Limit-Api-Token-Interval-Ms": "10000",
+                }
+            )
+        )
+        assert client._rl_token_remaining == 2
+        assert client._paused_until > time.monotonic() + 9
+        print("✓ Low remaining quota pauses new requests")
+        return True
+    except Exception as e:
+        print(f"✗ Rate-limit header test failed: {e}")
+        return False
+
+
+def test_retry_after_parsing():
+    """Test that Retry-After accepts seconds or HTTP-dates and ignores junk."""
+    print("\nTesting Retry-After parsing...")
+
+    from datetime import datetime, timedelta, timezone
+    from email.utils import format_datetime
+    import httpx
+    from server.exceptions import RateLimitError
+    from server.utils.trello_api import TrelloClient, _parse_retry_after
+
+    try:
+        assert _parse_retry_after("5") == 5.0
+        assert _parse_retry_after("1.5") == 1.5
+        assert _parse_retry_after(None) is None
+        assert _parse_retry_after("soon") is None
+        assert _parse_retry_after("inf") is None
+        soon = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+        assert 25 < _parse_retry_after(soon) <= 30
+        past = format_datetime(datetime.now(timezone.utc) - timedelta(seconds=30), usegmt=True)
+        assert _parse_retry_after(past) == 0.0
+
+        client = TrelloClient(api_key="key", token="token")
+        request = httpx.Request("GET", "https://api.trello.com/1/boards/abc")
+        response = httpx.Response(429, headers={"Retry-After": "soon"}, request=request)
+        try:
+            client._handle_http_error(
+                httpx.HTTPStatusError("", request=request, response=response),
+                "/boards/abc",
+                "GET",
+            )
+        except RateLimitError as e:
+            assert e.retry_after is None
+        print("✓ Retry-After parsed defensively")
+        return True
+    except Exception as e:
+        print(f"✗ Retry-After parsing test failed: {e!r}")
+        return False
+
+
+def test_shared_client():
+    """Test that every tool module shares one TrelloClient instance."""
+    print("\nTesting shared client singleton...")
+
+    try:
+        from server.trello import get_client
+        from server.tools import board, card, webhook, workspace
+
+        shared = get_client()
+        assert get_client() is shared
+        for module in (board, card, webhook, workspace):
+            assert id(module.client) == id(shared), module.__name__
+        print("✓ All tool modules use the same TrelloClient")
+        return True
+    except Exception as e:
+        print(f"✗ Shared client test failed: {e}")
+        return False
+
+
+def test_stream_get():
+    """Test that stream_get yields array items decoded incrementally."""
+    print("\nTesting streamed GET...")
+
+    async def run():
+        import httpx
+        from server.utils.trello_api import TrelloClient
+
+        def handler(request):
+            return httpx.Response(200, content=b'[{"id": "a", "pos": 1.5}, {"id": "b"}]')
+
+        client = TrelloClient(api_key="key", token="token")
+        await client.client.aclose()
+        client.client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(handler)
+        )
+        items = [item async for item in client.stream_get("/tokens/token/webhooks")]
+        assert items == [{"id": "a", "pos": 1.5}, {"id": "b"}]
+        assert isinstance(items[0]["pos"], float)
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ Streamed GET yields each array element")
+        return True
+    except Exception as e:
+        print(f"✗ Streamed GET test failed: {e}")
+        return False
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Trello MCP Server TrelloClient Tests")
+    print("=" * 60)
+
+    tests = [
+        ("GET Cache", test_get_cache),
+        ("Cache Invalidation", test_cache_invalidation),
+        ("ETag Revalidation", test_etag_revalidation),
+        ("Batch Coalescing", test_batch_coalescing),
+        ("Batch Flush Cancelled", test_batch_flush_cancelled),
+        ("Single Flight", test_single_flight),
+        ("Single Flight Leader Cancelled", test_single_flight_leader_cancelled),
+        ("Write During In-Flight GET", test_write_during_inflight_get),
+        ("404 Parsing", test_not_found_parsing),
+        ("Validator Cache Sharing", test_validator_shares_cache),
+        ("Rate-Limit Headers", test_rate_limit_headers),
+        ("Retry-After Parsing", test_retry_after_parsing),
+        ("Shared Client", test_shared_client),
+        ("Streamed GET", test_stream_get),
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            result = test_func()
+            results.append((test_name, result))
+        except Exception as e:
+            print(f"\n✗ {test_name} failed with exception: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((test_name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for test_name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {test_name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("\n🎉 All tests passed!")
+        return 0
+    else:
+        print(f"\n❌ {total - passed} test(s) failed")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
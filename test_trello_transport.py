@@ -0,0 +1,336 @@
+"""
+Test script for TrelloClient's send path (_send_with_retry and _do).
+Runs offline by routing the real httpx client through httpx.MockTransport.
+"""
+
+import sys
+import os
+import asyncio
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+# Set dummy environment variables for testing
+os.environ["TRELLO_API_KEY"] = "test_api_key_for_testing_only"
+os.environ["TRELLO_TOKEN"] = "test_token_for_testing_only"
+
+
+def mock_client(handler):
+    """Create a TrelloClient whose HTTP requests are answered by ``handler``."""
+    import httpx
+    from server.utils.trello_api import TrelloClient
+
+    client = TrelloClient(api_key="key", token="token")
+    requests = []
+
+    def record(request):
+        requests.append(request)
+        return handler(request)
+
+    # The real client is still unopened, so it can be swapped synchronously.
+    client.client = httpx.AsyncClient(
+        base_url=client.base_url,
+        params={"key": "key", "token": "token"},
+        transport=httpx.MockTransport(record),
+    )
+    return client, requests
+
+
+@contextmanager
+def recorded_sleeps():
+    """Patch asyncio.sleep so retry delays are recorded instead of waited out."""
+    real_sleep = asyncio.sleep
+    delays = []
+
+    async def fake_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await real_sleep(0)
+
+    with patch.object(asyncio, "sleep", fake_sleep):
+        yield delays
+
+
+def test_error_translation():
+    """Test that HTTP errors become the matching TrelloMCPError subclass."""
+    print("Testing HTTP error translation...")
+
+    import httpx
+    from server.exceptions import (
+        ForbiddenError,
+        ResourceNotFoundError,
+        TrelloMCPError,
+        UnauthorizedError,
+    )
+
+    cases = [
+        (401, UnauthorizedError),
+        (403, ForbiddenError),
+        (404, ResourceNotFoundError),
+        (500, TrelloMCPError),
+    ]
+
+    async def run():
+        for status_code, expected in cases:
+            client, requests = mock_client(lambda request: httpx.Response(status_code))
+            with recorded_sleeps() as delays:
+                try:
+                    await client.GET("/boards/abc")
+                except TrelloMCPError as e:
+                    assert type(e) is expected, (status_code, type(e))
+                    assert e.status_code == status_code
+                else:
+                    raise AssertionError(f"{status_code} did not raise")
+            # Non-429 HTTP errors are final
+            assert len(requests) == 1 and not delays, status_code
+            await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ HTTP errors translated without retrying")
+        return True
+    except Exception as e:
+        print(f"✗ Error translation test failed: {e!r}")
+        return False
+
+
+def test_bad_request_not_retried():
+    """Test that a 400 raises BadRequestError after a single attempt."""
+    print("\nTesting 400 handling...")
+
+    import httpx
+    from server.exceptions import BadRequestError
+
+    async def run():
+        client, requests = mock_client(
+            lambda request: httpx.Response(400, text="invalid value for name")
+        )
+        with recorded_sleeps() as delays:
+            try:
+                await client.POST("/boards", data={"name": ""})
+            except BadRequestError as e:
+                assert "invalid value for name" in e.message
+            else:
+                raise AssertionError("400 did not raise")
+        assert len(requests) == 1
+        assert not delays
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ 400 raised BadRequestError without a retry")
+        return True
+    except Exception as e:
+        print(f"✗ 400 handling test failed: {e!r}")
+        return False
+
+
+def test_network_retry_jitter():
+    """Test that network errors are retried with bounded decorrelated jitter."""
+    print("\nTesting network retry backoff...")
+
+    import random
+    import httpx
+    from server.exceptions import TrelloMCPError
+    from server.utils.trello_api import RETRY_BASE_DELAY, RETRY_MAX_DELAY
+
+    async def run():
+        failures = 5
+
+        def flaky(request):
+            if len(requests) <= failures:
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(200, json={"id": "abc"})
+
+        client, requests = mock_client(flaky)
+        client.max_retries = failures + 1
+        random.seed(0)
+        with recorded_sleeps() as delays:
+            assert await client.GET("/boards/abc") == {"id": "abc"}
+        assert len(requests) == failures + 1
+        assert len(delays) == failures
+        last = RETRY_BASE_DELAY
+        for delay in delays:
+            assert RETRY_BASE_DELAY <= delay <= min(RETRY_MAX_DELAY, last * 3), delays
+            last = delay
+        await client.close()
+
+        # Exhausting every attempt surfaces a TrelloMCPError
+        def timeout(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        client, requests = mock_client(timeout)
+        with recorded_sleeps() as delays:
+            try:
+                await client.GET("/boards/abc")
+            except TrelloMCPError as e:
+                assert "after 3 attempts" in e.message
+            else:
+                raise AssertionError("exhausted retries did not raise")
+        assert len(requests) == 3
+        assert len(delays) == 2
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ Network errors retried within the jitter bounds")
+        return True
+    except Exception as e:
+        print(f"✗ Network retry test failed: {e!r}")
+        return False
+
+
+def test_retry_after_floor():
+    """Test that a 429 waits at least Retry-After and pauses other callers."""
+    print("\nTesting Retry-After floor...")
+
+    import httpx
+
+    async def run():
+        def limited(request):
+            if not requests[1:]:
+                return httpx.Response(429, headers={"Retry-After": "20"})
+            return httpx.Response(200, json={"id": "abc"})
+
+        client, requests = mock_client(limited)
+        with recorded_sleeps() as delays:
+            assert await client.GET("/boards/abc") == {"id": "abc"}
+        assert len(requests) == 2
+        # The retry itself waited at least Retry-After...
+        assert delays[0] >= 20, delays
+        # ...and the pause made the next admission wait out the window too.
+        assert len(delays) == 2 and delays[1] > 19, delays
+        assert client._paused_until > time.monotonic() + 19
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ Retry-After honoured as a floor for every caller")
+        return True
+    except Exception as e:
+        print(f"✗ Retry-After floor test failed: {e!r}")
+        return False
+
+
+def test_admission_control():
+    """Test the concurrency semaphore and the configured rate limiters."""
+    print("\nTesting admission control...")
+
+    import httpx
+
+    async def run():
+        in_flight = 0
+        peak = 0
+
+        async def slow(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"id": "abc"})
+
+        os.environ["TRELLO_TOKEN_RATE"] = "6"
+        try:
+            client, requests = mock_client(slow)
+        finally:
+            del os.environ["TRELLO_TOKEN_RATE"]
+        client._concurrency = 2
+        await asyncio.gather(*(client.GET(f"/boards/{i}") for i in range(6)))
+        assert len(requests) == 6
+        assert peak == 2, peak
+        # Six requests used the whole token bucket but little of the key bucket
+        assert not client._token_limiter.has_capacity()
+        assert client._key_limiter.has_capacity()
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ Concurrency capped and rate limiters consumed")
+        return True
+    except Exception as e:
+        print(f"✗ Admission control test failed: {e!r}")
+        return False
+
+
+def test_json_body_encoding():
+    """Test that request bodies are orjson-encoded with a JSON Content-Type."""
+    print("\nTesting JSON body encoding...")
+
+    import httpx
+    import orjson
+
+    async def run():
+        client, requests = mock_client(lambda request: httpx.Response(200, json={}))
+        data = {"name": "Board", "due": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)}
+        await client.PUT("/cards/abc", data=data, params={"fields": "id"})
+        await client.GET("/cards/abc")
+
+        put, get = requests
+        # orjson serialises datetimes natively, which the json module cannot
+        assert put.content == orjson.dumps(data)
+        assert put.headers["Content-Type"] == "application/json"
+        assert put.url.params["fields"] == "id"
+        assert put.url.params["key"] == "key" and put.url.params["token"] == "token"
+        assert get.content == b""
+        assert "Content-Type" not in get.headers
+        await client.close()
+
+    try:
+        asyncio.run(run())
+        print("✓ Bodies sent as orjson with Content-Type: application/json")
+        return True
+    except Exception as e:
+        print(f"✗ JSON body encoding test failed: {e!r}")
+        return False
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Trello MCP Server Transport Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Error Translation", test_error_translation),
+        ("400 Not Retried", test_bad_request_not_retried),
+        ("Network Retry Jitter", test_network_retry_jitter),
+        ("Retry-After Floor", test_retry_after_floor),
+        ("Admission Control", test_admission_control),
+        ("JSON Body Encoding", test_json_body_encoding),
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            result = test_func()
+            results.append((test_name, result))
+        except Exception as e:
+            print(f"\n✗ {test_name} failed with exception: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((test_name, False))
+
+    print("\n" + "=" * 60)
+    print("Test Results Summary")
+    print("=" * 60)
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for test_name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {test_name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("\n🎉 All tests passed!")
+        return 0
+    else:
+        print(f"\n❌ {total - passed} test(s) failed")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
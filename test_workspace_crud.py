@@ -155,7 +155,7 @@ def test_workspace_service_methods():
     import inspect
     
     create_sig = inspect.signature(service.create_workspace)
-    assert 'kwargs' in str(create_sig)
+    assert 'params' in str(create_sig)
     print("✓ create_workspace has correct signature")
     
     delete_sig = inspect.signature(service.delete_workspace)